@@ -1 +1,3 @@
 from .intelliType import IntelliType
+from .constraints import Range, Length, Pattern, Shape, Each
+from .backends import Backend, register_backend, set_default_backend
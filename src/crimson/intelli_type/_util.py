@@ -1,4 +1,17 @@
-from pydantic import create_model, ConfigDict
+import threading
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+from pydantic import create_model, ConfigDict, PydanticUserError, TypeAdapter
+
+
+_RECENT_SPECIALIZATIONS_SIZE = 256
+
+# Subclasses stay cached while they are referenced, so a subscript keeps returning the same class.
+_specializations = WeakValueDictionary()
+# Keeps the recently used subclasses alive, so inline use such as Batch[int].type_safe(...)
+# doesn't rebuild the subclass and its validator after every garbage collection.
+_recent_specializations = OrderedDict()
+_specializations_lock = threading.Lock()
 
 
 def _create_base_model(annotation, cls_name):
@@ -8,3 +21,71 @@ def _create_base_model(annotation, cls_name):
         __config__=ConfigDict(arbitrary_types_allowed=True),
     )
     return _BaseModel
+
+
+def _create_type_adapter(annotation):
+    try:
+        return TypeAdapter(annotation, config=ConfigDict(arbitrary_types_allowed=True))
+    except PydanticUserError:
+        # Models, dataclasses and TypedDicts carry their own config.
+        return TypeAdapter(annotation)
+
+
+def _parameterize(cls, params):
+    """
+    Create the concrete subclass of a parameterized IntelliType.
+    params follow the order declared in Generic[...].
+    """
+    substitution = dict(zip(cls.get_parameters(), params))
+    annotation = cls.annotation[tuple(substitution[param] for param in cls.annotation.__parameters__)]
+    name = f"{cls.__name__}[{', '.join(_type_repr(param) for param in params)}]"
+    return _specialize(cls, (cls, params), name, annotation, cls.meta)
+
+
+def _with_meta(cls, meta):
+    """
+    Create the subclass of an IntelliType with metadata given at the subscript.
+    The metadata is added to the metadata of the class.
+    """
+    merged_meta = (cls.meta or ()) + meta
+    return _specialize(cls, (cls, None, meta), cls.__name__, cls.annotation, merged_meta)
+
+
+def _specialize(cls, key, name, annotation, meta):
+    try:
+        hash(key)
+    except TypeError:
+        # Metadata is free-form and may be unhashable. Such subclasses aren't cached.
+        return _create_subclass(cls, name, annotation, meta)
+
+    with _specializations_lock:
+        subclass = _specializations.get(key)
+        if subclass is None:
+            subclass = _create_subclass(cls, name, annotation, meta)
+            _specializations[key] = subclass
+
+        _recent_specializations[key] = subclass
+        _recent_specializations.move_to_end(key)
+        if len(_recent_specializations) > _RECENT_SPECIALIZATIONS_SIZE:
+            _recent_specializations.popitem(last=False)
+    return subclass
+
+
+def _create_subclass(cls, name, annotation, meta):
+    return type(cls)(
+        name,
+        (cls,),
+        {
+            "__doc__": cls.__doc__,
+            "__module__": cls.__module__,
+            "__qualname__": name,
+            "annotation": annotation,
+            "meta": meta,
+        },
+    )
+
+
+def _type_repr(obj):
+    if isinstance(obj, type):
+        return obj.__name__
+    return repr(obj).replace("typing.", "")
@@ -0,0 +1,262 @@
+"""
+Backends building the validators of IntelliTypes.
+
+pydantic is the default backend.
+A backend is selected globally with `set_default_backend`,
+or per IntelliType with the `backend` attribute.
+
+ex)
+
+---
+``` python
+    class Ids(IntelliType[List[int]], Generic[T]):
+        '''
+        Validated by isinstance checks, without coercion.
+        '''
+        backend = "isinstance"
+
+    set_default_backend("msgspec")
+```
+---
+
+Every backend raises a ValueError for invalid data.
+"""
+
+import collections.abc
+import types
+from typing import (
+    Any,
+    Annotated,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from .constraints import (
+    _MAPPING_ORIGINS,
+    _SEQUENCE_ORIGINS,
+    Constraint,
+    check_constraints,
+    compile_constraints,
+)
+from ._util import _create_base_model
+
+Validator = Callable[[Any], Any]
+
+# X | Y unions have their own origin since python 3.10.
+_UNION_ORIGINS = (Union, types.UnionType) if hasattr(types, "UnionType") else (Union,)
+
+# Checking their items would consume them.
+_ONE_SHOT_ORIGINS = (
+    collections.abc.Iterable,
+    collections.abc.Iterator,
+    collections.abc.Generator,
+    collections.abc.AsyncIterable,
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncGenerator,
+)
+
+
+class Backend:
+    """
+    build raises a TypeError for annotations the backend doesn't support.
+    """
+
+    name: str = None
+
+    def is_available(self) -> bool:
+        return True
+
+    def build(
+        self, annotation: Any, constraints: Tuple[Constraint, ...] = (), name: str = "Validator"
+    ) -> Validator:
+        raise NotImplementedError
+
+    def build_intelli_type(self, intelli_type: Any, constraints: Tuple[Constraint, ...]) -> Validator:
+        return self.build(intelli_type.get_annotation(), constraints, intelli_type.__name__)
+
+
+class PydanticBackend(Backend):
+    name = "pydantic"
+
+    def build(
+        self, annotation: Any, constraints: Tuple[Constraint, ...] = (), name: str = "Validator"
+    ) -> Validator:
+        base_model = _create_base_model(compile_constraints(annotation, constraints), name)
+        if not base_model.__pydantic_complete__:
+            raise TypeError(f"Unsupported annotation for the pydantic backend: {annotation}")
+        return _wrap_base_model(base_model)
+
+    def build_intelli_type(self, intelli_type: Any, constraints: Tuple[Constraint, ...]) -> Validator:
+        # Shares the model with get_base_model and the dump methods.
+        return _wrap_base_model(intelli_type.create_base_model())
+
+
+class IsinstanceBackend(Backend):
+    """
+    Checks the data with isinstance only. The data is returned as it is, without coercion.
+    """
+
+    name = "isinstance"
+
+    def build(
+        self, annotation: Any, constraints: Tuple[Constraint, ...] = (), name: str = "Validator"
+    ) -> Validator:
+        check = _build_check(annotation)
+
+        def validate(data: Any) -> Any:
+            if not check(data):
+                raise ValueError(f"{name}: {data!r} is not an instance of {annotation}")
+            _check_constraints(data, constraints, name)
+            return data
+
+        return validate
+
+
+class MsgspecBackend(Backend):
+    """
+    Converts the data with msgspec.convert. It is available only if msgspec is installed.
+    """
+
+    name = "msgspec"
+
+    _available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        if self._available is None:
+            try:
+                import msgspec  # noqa: F401
+            except ImportError:
+                self._available = False
+            else:
+                self._available = True
+        return self._available
+
+    def build(
+        self, annotation: Any, constraints: Tuple[Constraint, ...] = (), name: str = "Validator"
+    ) -> Validator:
+        import msgspec
+
+        # Raises TypeError for annotations msgspec doesn't support.
+        msgspec.inspect.type_info(annotation)
+
+        def validate(data: Any) -> Any:
+            try:
+                data = msgspec.convert(data, type=annotation)
+            except msgspec.ValidationError as error:
+                raise ValueError(f"{name}: {error}") from error
+            _check_constraints(data, constraints, name)
+            return data
+
+        return validate
+
+
+_backends: Dict[str, Backend] = {}
+_default_backend = PydanticBackend.name
+
+
+def register_backend(backend: Backend):
+    _backends[backend.name] = backend
+
+
+def get_backend(name: Optional[str] = None) -> Backend:
+    name = _default_backend if name is None else name
+    backend = _backends.get(name)
+    if backend is None:
+        raise KeyError(f"Unknown backend: {name}")
+    if not backend.is_available():
+        raise RuntimeError(f"Backend {name} is not available")
+    return backend
+
+
+def get_default_backend() -> str:
+    return _default_backend
+
+
+def set_default_backend(name: str):
+    global _default_backend
+    get_backend(name)
+    _default_backend = name
+
+
+def available_backends() -> List[str]:
+    return [name for name, backend in _backends.items() if backend.is_available()]
+
+
+register_backend(PydanticBackend())
+register_backend(IsinstanceBackend())
+register_backend(MsgspecBackend())
+
+
+def _wrap_base_model(base_model: Any) -> Validator:
+    def validate(data: Any) -> Any:
+        return base_model(data=data).data
+
+    return validate
+
+
+def _check_constraints(data: Any, constraints: Tuple[Constraint, ...], name: str):
+    try:
+        check_constraints(data, constraints)
+    except TypeError as error:
+        # For example Range on a str of Union[int, str].
+        raise ValueError(f"{name}: {error}") from error
+
+
+def _build_check(annotation: Any) -> Callable[[Any], bool]:
+    if annotation is Any or annotation is object or isinstance(annotation, TypeVar):
+        return lambda data: True
+    if annotation is None or annotation is type(None):
+        return lambda data: data is None
+
+    origin, args = get_origin(annotation), get_args(annotation)
+
+    if origin is Annotated:
+        return _build_check(args[0])
+    if origin in _UNION_ORIGINS:
+        checks = [_build_check(arg) for arg in args]
+        return lambda data: any(check(data) for check in checks)
+    if origin is Literal:
+        return lambda data: any(type(data) is type(arg) and data == arg for arg in args)
+    if origin is tuple:
+        return _build_tuple_check(args)
+    if origin in _MAPPING_ORIGINS and args:
+        check_key, check_value = _build_check(args[0]), _build_check(args[1])
+        return lambda data: isinstance(data, origin) and all(
+            check_key(key) and check_value(value) for key, value in data.items()
+        )
+    if origin in _ONE_SHOT_ORIGINS and args:
+        raise TypeError(f"The isinstance backend can't check the items of {annotation} without consuming them")
+    if origin in _SEQUENCE_ORIGINS and args:
+        check_item = _build_check(args[0])
+        return lambda data: isinstance(data, origin) and not isinstance(data, (str, bytes)) and all(
+            check_item(item) for item in data
+        )
+    if origin is not None:
+        return lambda data: isinstance(data, origin)
+    if isinstance(annotation, type):
+        return lambda data: isinstance(data, annotation)
+
+    raise TypeError(f"Unsupported annotation for the isinstance backend: {annotation}")
+
+
+def _build_tuple_check(args: Tuple[Any, ...]) -> Callable[[Any], bool]:
+    if len(args) == 2 and args[1] is Ellipsis:
+        check_item = _build_check(args[0])
+        return lambda data: isinstance(data, tuple) and all(check_item(item) for item in data)
+
+    checks = [_build_check(arg) for arg in args]
+
+    def check_tuple(data: Any) -> bool:
+        if not isinstance(data, tuple) or len(data) != len(checks):
+            return False
+        return all(check(item) for check, item in zip(checks, data))
+
+    return check_tuple
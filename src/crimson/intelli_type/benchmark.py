@@ -0,0 +1,139 @@
+"""
+Runs a corpus of annotations through every available backend,
+and reports their throughput and whether they agree.
+
+ex)
+
+---
+``` python
+    corpus = [
+        (List[int], [[1, 2, 3], ["a"]]),
+        (Dict[str, float], [{"a": 1.0}]),
+    ]
+    print(format_report(run_benchmark(corpus)))
+```
+---
+
+Run `python -m crimson.intelli_type.benchmark` for the default corpus.
+"""
+
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .backends import available_backends, get_backend
+from ._util import _type_repr
+
+Corpus = Sequence[Tuple[Any, Sequence[Any]]]
+
+
+class BackendRun(NamedTuple):
+    backend: str
+    # Validations per second. None if the backend doesn't support the annotation.
+    throughput: Optional[float]
+    # (accepted, output) per sample.
+    outcomes: Optional[Tuple[Tuple[bool, Any], ...]]
+    error: Optional[str]
+
+
+class AnnotationReport(NamedTuple):
+    annotation: Any
+    runs: Tuple[BackendRun, ...]
+    # Indices of the samples on which the supporting backends disagree.
+    disagreements: Tuple[int, ...]
+
+    @property
+    def agree(self) -> bool:
+        return not self.disagreements
+
+
+DEFAULT_CORPUS: Corpus = [
+    (int, [1, "1", 1.5, None]),
+    (str, ["a", 1]),
+    (List[int], [list(range(100)), [1, "2"], "abc"]),
+    (Dict[str, List[float]], [{"a": [1.0, 2.5]}, {"a": [1]}, {1: []}]),
+    (Tuple[int, str], [(1, "a"), [1, "a"], (1, 2)]),
+    (Optional[Union[int, str]], [None, 1, "a", 1.0]),
+]
+
+
+def run_benchmark(
+    corpus: Corpus = DEFAULT_CORPUS,
+    backends: Optional[Sequence[str]] = None,
+    number: int = 1000,
+) -> List[AnnotationReport]:
+    backends = available_backends() if backends is None else backends
+    reports = []
+    for annotation, samples in corpus:
+        runs = tuple(_run(backend, annotation, samples, number) for backend in backends)
+        reports.append(
+            AnnotationReport(annotation, runs, _find_disagreements(runs, len(samples)))
+        )
+    return reports
+
+
+def format_report(reports: Sequence[AnnotationReport]) -> str:
+    backends = [run.backend for run in reports[0].runs] if reports else []
+    header = ["annotation"] + [f"{backend} (/s)" for backend in backends] + ["agree"]
+    rows = [header]
+    for report in reports:
+        row = [_type_repr(report.annotation)]
+        for run in report.runs:
+            row.append("unsupported" if run.throughput is None else f"{run.throughput:,.0f}")
+        if report.agree:
+            row.append("yes")
+        else:
+            row.append("no " + ",".join(str(index) for index in report.disagreements))
+        rows.append(row)
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def _run(backend_name: str, annotation: Any, samples: Sequence[Any], number: int) -> BackendRun:
+    backend = get_backend(backend_name)
+    try:
+        validate = backend.build(annotation, name="Benchmark")
+    except TypeError as error:
+        return BackendRun(backend_name, None, None, str(error))
+
+    outcomes = tuple(_validate(validate, sample) for sample in samples)
+
+    start = time.perf_counter()
+    for _ in range(number):
+        for sample in samples:
+            try:
+                validate(sample)
+            except ValueError:
+                pass
+    elapsed = time.perf_counter() - start
+
+    throughput = number * len(samples) / elapsed if elapsed > 0 else float("inf")
+    return BackendRun(backend_name, throughput, outcomes, None)
+
+
+def _validate(validate, sample: Any) -> Tuple[bool, Any]:
+    try:
+        return True, validate(sample)
+    except ValueError:
+        return False, None
+
+
+def _find_disagreements(runs: Sequence[BackendRun], n_samples: int) -> Tuple[int, ...]:
+    supported = [run.outcomes for run in runs if run.outcomes is not None]
+    disagreements = []
+    for index in range(n_samples):
+        outcomes = [outcome[index] for outcome in supported]
+        if any(not _same(outcome, outcomes[0]) for outcome in outcomes[1:]):
+            disagreements.append(index)
+    return tuple(disagreements)
+
+
+def _same(left: Tuple[bool, Any], right: Tuple[bool, Any]) -> bool:
+    return left[0] == right[0] and type(left[1]) is type(right[1]) and left[1] == right[1]
+
+
+if __name__ == "__main__":
+    print(format_report(run_benchmark()))
@@ -0,0 +1,213 @@
+"""
+Constraints written in the metadata of an IntelliType.
+
+ex)
+
+---
+``` python
+    class Probabilities(IntelliType[List[float], Each(Range(ge=0, le=1)), Length(min=1)], Generic[T]):
+        '''
+        Non-empty list of probabilities.
+        '''
+```
+---
+
+The constraints are compiled into the annotation validated by pydantic,
+so they are checked in the same pass as the annotation itself.
+Backends without such support call `check` on the validated value.
+Other metadata is ignored.
+"""
+
+import collections.abc
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Annotated, Optional, Tuple, get_args, get_origin
+
+import annotated_types
+from pydantic import AfterValidator, Field
+
+
+_COMPILATION_CACHE_SIZE = 256
+
+_SEQUENCE_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+
+_MAPPING_ORIGINS = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+
+
+class Constraint:
+    def apply(self, annotation: Any) -> Any:
+        raise NotImplementedError
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: Any) -> Any:
+        # Lets pydantic apply a constraint found in Annotated[..., constraint].
+        return handler(self.apply(source))
+
+    def check(self, value: Any) -> None:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Range(Constraint):
+    ge: Any = None
+    gt: Any = None
+    le: Any = None
+    lt: Any = None
+
+    def apply(self, annotation: Any) -> Any:
+        return Annotated[
+            annotation,
+            annotated_types.Interval(ge=self.ge, gt=self.gt, le=self.le, lt=self.lt),
+        ]
+
+    def check(self, value: Any) -> None:
+        in_range = all([
+            self.ge is None or value >= self.ge,
+            self.gt is None or value > self.gt,
+            self.le is None or value <= self.le,
+            self.lt is None or value < self.lt,
+        ])
+        if not in_range:
+            raise ValueError(f"{value!r} is out of {self}")
+
+
+@dataclass(frozen=True)
+class Length(Constraint):
+    min: int = 0
+    max: Optional[int] = None
+
+    def apply(self, annotation: Any) -> Any:
+        return Annotated[annotation, annotated_types.Len(self.min, self.max)]
+
+    def check(self, value: Any) -> None:
+        if len(value) < self.min or (self.max is not None and len(value) > self.max):
+            raise ValueError(f"Length {len(value)} is out of {self}")
+
+
+@dataclass(frozen=True)
+class Pattern(Constraint):
+    regex: str
+
+    def apply(self, annotation: Any) -> Any:
+        return Annotated[annotation, Field(pattern=self.regex)]
+
+    def check(self, value: Any) -> None:
+        if re.search(self.regex, value) is None:
+            raise ValueError(f"{value!r} doesn't match {self.regex!r}")
+
+
+@dataclass(frozen=True)
+class Shape(Constraint):
+    """
+    Checks the `shape` attribute of arrays and tensors, or the lengths of nested sequences.
+    None matches any size.
+    """
+
+    dims: Tuple[Optional[int], ...]
+
+    def __init__(self, *dims: Optional[int]):
+        object.__setattr__(self, "dims", dims)
+
+    def apply(self, annotation: Any) -> Any:
+        return Annotated[annotation, AfterValidator(self._validate)]
+
+    def _validate(self, value: Any) -> Any:
+        check_constraints(value, (self,))
+        return value
+
+    def check(self, value: Any) -> None:
+        shape = getattr(value, "shape", None)
+        if shape is not None:
+            matched = _match_dims(tuple(shape), self.dims)
+        else:
+            matched = _match_nested(value, self.dims)
+        if not matched:
+            raise ValueError(f"Shape mismatch: expected {self.dims}")
+
+
+@dataclass(frozen=True)
+class Each(Constraint):
+    """
+    Applies the constraints to every item of a sequence, or every value of a mapping.
+    """
+
+    constraints: Tuple[Constraint, ...]
+
+    def __init__(self, *constraints: Constraint):
+        object.__setattr__(self, "constraints", constraints)
+
+    def apply(self, annotation: Any) -> Any:
+        origin, args = get_origin(annotation), get_args(annotation)
+
+        if origin is Annotated:
+            return Annotated[(self.apply(args[0]),) + args[1:]]
+        if origin in _SEQUENCE_ORIGINS and len(args) == 1:
+            return origin[self._apply_item(args[0])]
+        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+            return tuple[self._apply_item(args[0]), ...]
+        if origin is tuple and args:
+            return tuple[tuple(self._apply_item(arg) for arg in args)]
+        if origin in _MAPPING_ORIGINS and len(args) == 2:
+            return origin[args[0], self._apply_item(args[1])]
+
+        raise TypeError(f"Each cannot be applied to {annotation}")
+
+    def _apply_item(self, annotation: Any) -> Any:
+        return _apply_constraints(annotation, self.constraints)
+
+    def check(self, value: Any) -> None:
+        items = value.values() if isinstance(value, collections.abc.Mapping) else value
+        for item in items:
+            check_constraints(item, self.constraints)
+
+
+def get_constraints(meta: Optional[Tuple[Any, ...]]) -> Tuple[Constraint, ...]:
+    return tuple(item for item in meta or () if isinstance(item, Constraint))
+
+
+@lru_cache(maxsize=_COMPILATION_CACHE_SIZE)
+def compile_constraints(annotation: Any, constraints: Tuple[Constraint, ...]) -> Any:
+    return _apply_constraints(annotation, constraints)
+
+
+def check_constraints(value: Any, constraints: Tuple[Constraint, ...]) -> None:
+    # The value already passed the annotation, so None is allowed there.
+    # pydantic applies the constraints of Optional[X] to X only.
+    if value is None:
+        return
+    for constraint in constraints:
+        constraint.check(value)
+
+
+def _apply_constraints(annotation: Any, constraints: Tuple[Constraint, ...]) -> Any:
+    for constraint in constraints:
+        annotation = constraint.apply(annotation)
+    return annotation
+
+
+def _match_dims(shape: Tuple[int, ...], dims: Tuple[Optional[int], ...]) -> bool:
+    if len(shape) != len(dims):
+        return False
+    return all(dim is None or dim == size for size, dim in zip(shape, dims))
+
+
+def _match_nested(value: Any, dims: Tuple[Optional[int], ...]) -> bool:
+    if not dims:
+        return not isinstance(value, (list, tuple))
+    if not isinstance(value, (list, tuple)):
+        return False
+    if dims[0] is not None and len(value) != dims[0]:
+        return False
+    return all(_match_nested(item, dims[1:]) for item in value)
@@ -0,0 +1,222 @@
+"""
+Static extraction of IntelliType definitions.
+
+The source is parsed with `ast` and never executed,
+so heavy dependencies imported by the scanned modules (torch, ...) are not loaded.
+
+ex)
+
+---
+``` python
+    from crimson.intelli_type.extractor import extract_intelli_types, scan_intelli_types
+
+    infos = extract_intelli_types("example/fusion_block_edit.py")
+    tree = scan_intelli_types("src")
+```
+---
+"""
+
+import ast
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class IntelliTypeInfo(NamedTuple):
+    name: str
+    annotation: str
+    meta: Optional[Tuple[Any, ...]]
+    doc: Optional[str]
+    parameters: Tuple[str, ...]
+    path: str
+    lineno: int
+
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    digest: str
+    infos: List[IntelliTypeInfo]
+
+
+# Files with fewer misses than this are parsed in the calling process.
+_PARALLEL_THRESHOLD = 16
+
+_cache: Dict[str, _CacheEntry] = {}
+
+
+def extract_intelli_types(path: str) -> List[IntelliTypeInfo]:
+    path = os.path.abspath(path)
+    infos = _lookup_cache(path)
+    if infos is not None:
+        return infos
+
+    mtime_ns, data = _read(path)
+    digest = _digest(data)
+    infos = _reuse_by_digest(path, mtime_ns, digest)
+    if infos is None:
+        infos = _extract_from_bytes(data, path)
+        _cache[path] = _CacheEntry(mtime_ns, digest, infos)
+    return infos
+
+
+def extract_source(source: str, path: str = "<string>") -> List[IntelliTypeInfo]:
+    tree = ast.parse(source, filename=path)
+    return _extract_from_tree(tree, path)
+
+
+def scan_intelli_types(
+    root: str, max_workers: Optional[int] = None
+) -> Dict[str, List[IntelliTypeInfo]]:
+    """
+    Extract the IntelliTypes of every python file under root.
+
+    Unchanged files are served from the cache.
+    The others are parsed in a process pool when there are enough of them.
+    Files without IntelliTypes are omitted from the result.
+    """
+    results: Dict[str, List[IntelliTypeInfo]] = {}
+    misses: List[Tuple[str, int, str, bytes]] = []
+
+    for path in _iter_python_files(os.path.abspath(root)):
+        infos = _lookup_cache(path)
+        if infos is None:
+            mtime_ns, data = _read(path)
+            digest = _digest(data)
+            infos = _reuse_by_digest(path, mtime_ns, digest)
+            if infos is None:
+                misses.append((path, mtime_ns, digest, data))
+                continue
+        results[path] = infos
+
+    if len(misses) < _PARALLEL_THRESHOLD or max_workers == 1:
+        extracted = [_extract_from_bytes(data, path) for path, _, _, data in misses]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            extracted = list(
+                executor.map(
+                    _extract_from_bytes,
+                    [data for _, _, _, data in misses],
+                    [path for path, _, _, _ in misses],
+                    chunksize=max(1, len(misses) // (4 * (max_workers or os.cpu_count() or 1))),
+                )
+            )
+
+    for (path, mtime_ns, digest, _), infos in zip(misses, extracted):
+        _cache[path] = _CacheEntry(mtime_ns, digest, infos)
+        results[path] = infos
+
+    return {path: infos for path, infos in sorted(results.items()) if infos}
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _lookup_cache(path: str) -> Optional[List[IntelliTypeInfo]]:
+    entry = _cache.get(path)
+    if entry is not None and entry.mtime_ns == os.stat(path).st_mtime_ns:
+        return entry.infos
+    return None
+
+
+def _reuse_by_digest(path: str, mtime_ns: int, digest: str) -> Optional[List[IntelliTypeInfo]]:
+    # The file was touched but its content is unchanged.
+    entry = _cache.get(path)
+    if entry is not None and entry.digest == digest:
+        _cache[path] = entry._replace(mtime_ns=mtime_ns)
+        return entry.infos
+    return None
+
+
+def _read(path: str) -> Tuple[int, bytes]:
+    with open(path, "rb") as file:
+        mtime_ns = os.fstat(file.fileno()).st_mtime_ns
+        return mtime_ns, file.read()
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _iter_python_files(root: str):
+    if os.path.isfile(root):
+        yield root
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                yield os.path.join(dirpath, filename)
+
+
+def _extract_from_bytes(data: bytes, path: str) -> List[IntelliTypeInfo]:
+    try:
+        tree = ast.parse(data, filename=path)
+    except (SyntaxError, ValueError):
+        return []
+    return _extract_from_tree(tree, path)
+
+
+def _extract_from_tree(tree: ast.AST, path: str) -> List[IntelliTypeInfo]:
+    infos = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        intelli_base = next((base for base in node.bases if _is_intelli_type_base(base)), None)
+        if intelli_base is None:
+            continue
+
+        annotation, meta = _handle_slice(intelli_base.slice)
+        infos.append(
+            IntelliTypeInfo(
+                name=node.name,
+                annotation=annotation,
+                meta=meta,
+                doc=ast.get_docstring(node),
+                parameters=_get_parameters(node),
+                path=path,
+                lineno=node.lineno,
+            )
+        )
+    return sorted(infos, key=lambda info: info.lineno)
+
+
+def _is_intelli_type_base(base: ast.expr) -> bool:
+    if not isinstance(base, ast.Subscript):
+        return False
+    return _get_name(base.value) == "IntelliType"
+
+
+def _get_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _handle_slice(slice_: ast.expr) -> Tuple[str, Optional[Tuple[Any, ...]]]:
+    if isinstance(slice_, ast.Tuple):
+        annotation = slice_.elts[0]
+        meta = tuple(_literal_or_source(elt) for elt in slice_.elts[1:])
+    else:
+        annotation = slice_
+        meta = None
+    return ast.unparse(annotation), meta
+
+
+def _literal_or_source(node: ast.expr) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return ast.unparse(node)
+
+
+def _get_parameters(node: ast.ClassDef) -> Tuple[str, ...]:
+    for base in node.bases:
+        if isinstance(base, ast.Subscript) and _get_name(base.value) == "Generic":
+            slice_ = base.slice
+            elts = slice_.elts if isinstance(slice_, ast.Tuple) else [slice_]
+            return tuple(ast.unparse(elt) for elt in elts)
+    return ()
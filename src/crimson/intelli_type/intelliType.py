@@ -1,7 +1,10 @@
-from typing import Any, Type, Tuple, Union, TypeVar, Generic
+import threading
+from typing import Any, Annotated, Callable, Dict, Optional, Type, Tuple, Union, TypeVar, Generic, get_args, get_origin
 from types import GenericAlias
-from pydantic import BaseModel
-from ._util import _create_base_model
+from pydantic import BaseModel, TypeAdapter
+from ._util import _create_base_model, _create_type_adapter, _parameterize, _with_meta
+from .constraints import compile_constraints, get_constraints
+from .backends import get_backend, get_default_backend
 
 T = TypeVar("T")
 
@@ -38,24 +41,61 @@ class IntelliType(Generic[T]):
     ---
 
     If you hover on MyIntelliType, you can read the description.
+
+    An annotation with type variables makes the IntelliType parameterized.
+    Each parameterization is a subclass sharing the description, with its own validator.
+
+    ex)
+
+    ---
+    ``` python
+        class Batch(IntelliType[List[T]], Generic[T]):
+            '''
+            Description shared by every Batch.
+            '''
+        Batch[int].type_safe([1, 2, 3])
+    ```
+    ---
     """
 
     _BaseModel: Type[BaseModel] = None
-    # For dynamic validation implemented in the future
+    _type_adapter: TypeAdapter = None
+    _constrained_base_models: Dict[Tuple[Any, ...], Type[BaseModel]] = {}
+    # Validators per backend name.
+    _validators: Dict[str, Callable[[Any], Any]] = {}
+    _constraints: Tuple[Any, ...] = None
+    # Serializes the lazy builds of the class, so each validator is built once.
+    _build_lock = threading.RLock()
+    # Constraints in meta are validated together with the annotation.
     meta: Tuple[Any] = None
 
     annotation: Type[T] = None
 
+    # Name of the validation backend. None uses the default backend.
+    backend: Optional[str] = None
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        if hasattr(cls, '_annotation_tmp'):
-            cls.annotation = cls._annotation_tmp
-            cls.meta = cls._meta_tmp   
+        cls._BaseModel = None
+        cls._type_adapter = None
+        cls._constrained_base_models = {}
+        cls._validators = {}
+        cls._constraints = None
+        cls._build_lock = threading.RLock()
+        # Subclasses created with their annotation, such as parameterizations,
+        # must not consume an annotation left by another IntelliType[...].
+        if "annotation" not in cls.__dict__ and "_annotation_tmp" in IntelliType.__dict__:
+            cls.annotation = IntelliType._annotation_tmp
+            cls.meta = IntelliType._meta_tmp
+            del IntelliType._annotation_tmp, IntelliType._meta_tmp
 
     def __class_getitem__(
         cls, annotation: Union[Type[T], Tuple[Type[T], ...]]
     ) -> Type[T]:
 
+        if cls.__name__ != "IntelliType" and cls.get_parameters():
+            return _handle_parameters(cls, annotation, len(cls.get_parameters()))
+
         annotation, meta = _handle_meta(annotation)
 
         if cls.__name__ == "IntelliType":
@@ -66,11 +106,13 @@ class IntelliType(Generic[T]):
             cls.create_annotation()
 
         else:
-            cls.meta = meta
             if cls.annotation != annotation:
                 raise TypeError(
                     f"Type mismatch: expected {cls.annotation}, but got {annotation}"
                 )
+            elif meta:
+                # The class is never modified. The metadata of the class comes first.
+                return Annotated[(annotation,) + (cls.meta or ()) + meta]
             else:
                 return annotation
 
@@ -88,10 +130,32 @@ class IntelliType(Generic[T]):
             return
         cls.annotation = annotation
 
+    @classmethod
+    def get_parameters(cls) -> Tuple[TypeVar, ...]:
+        parameters = getattr(cls.get_annotation(), "__parameters__", ())
+        if not parameters:
+            return ()
+
+        # The order declared in Generic[...] wins over the order in the annotation.
+        declared = next(
+            (get_args(base) for base in getattr(cls, "__orig_bases__", ()) if get_origin(base) is Generic),
+            (),
+        )
+        ordered = tuple(param for param in declared if param in parameters)
+        return ordered + tuple(param for param in parameters if param not in ordered)
+
     @classmethod
     def get_meta(cls) -> Tuple[Any]:
         return cls.meta
 
+    @classmethod
+    def with_meta(cls, *meta: Any) -> Type[T]:
+        """
+        Subclass with the metadata of the class followed by the given metadata.
+        It is cached per distinct metadata, with its own validator.
+        """
+        return _with_meta(cls, meta)
+
     # I am not sure if we need them. They can be deprecated.
 
     @classmethod
@@ -100,16 +164,96 @@ class IntelliType(Generic[T]):
 
     @classmethod
     def type_safe(cls: Type[T], data: Any) -> T:
-        return cls.get_base_model()(data=data).data
+        return cls.get_validator()(data)
+
+    @classmethod
+    def get_validator(cls) -> Callable[[Any], Any]:
+        # Lock-free once built, as it runs on every type_safe call.
+        backend_name = cls.backend or get_default_backend()
+        validator = cls._validators.get(backend_name)
+        if validator is None:
+            with cls._build_lock:
+                validator = cls._validators.get(backend_name)
+                if validator is None:
+                    backend = get_backend(backend_name)
+                    validator = backend.build_intelli_type(cls, cls._get_constraints())
+                    cls._validators[backend_name] = validator
+
+        return validator
+
+    @classmethod
+    def _get_constraints(cls) -> Tuple[Any, ...]:
+        # The metadata of a class is fixed, so its constraints are collected once.
+        if cls._constraints is None:
+            cls._constraints = get_constraints(cls.get_meta())
+        return cls._constraints
+
+    @classmethod
+    def dump_python(cls, value: Any, mode: str = "python", validate: bool = False) -> Any:
+        """
+        Serialize a value returned by type_safe with the schema of the class.
+        It isn't validated again unless validate is True.
+        """
+        type_adapter = cls.get_type_adapter()
+        if validate:
+            value = type_adapter.validate_python(value)
+        return type_adapter.dump_python(value, mode=mode)
+
+    @classmethod
+    def dump_json(cls, value: Any, validate: bool = False) -> bytes:
+        """
+        Serialize a value returned by type_safe to JSON with the schema of the class.
+        It isn't validated again unless validate is True.
+        """
+        type_adapter = cls.get_type_adapter()
+        if validate:
+            value = type_adapter.validate_python(value)
+        return type_adapter.dump_json(value)
+
+    @classmethod
+    def get_type_adapter(cls) -> TypeAdapter:
+        if cls._type_adapter is None:
+            with cls._build_lock:
+                if cls._type_adapter is None:
+                    annotation = compile_constraints(cls.get_annotation(), cls._get_constraints())
+                    cls._type_adapter = _create_type_adapter(annotation)
+
+        return cls._type_adapter
 
     @classmethod
     def create_base_model(cls) -> Type[BaseModel]:
+        constraints = cls._get_constraints()
+        if constraints:
+            return cls._create_constrained_base_model(constraints)
+
+        # Lock-free once built. Concurrent first calls wait for a single build.
         if cls._BaseModel is None:
-            annotation = cls.get_annotation()
-            cls._BaseModel = _create_base_model(annotation, cls.__name__)
+            with cls._build_lock:
+                if cls._BaseModel is None:
+                    annotation = cls.get_annotation()
+                    cls._BaseModel = _create_base_model(annotation, cls.__name__)
 
         return cls._BaseModel
 
+    @classmethod
+    def _create_constrained_base_model(cls, constraints: Tuple[Any, ...]) -> Type[BaseModel]:
+        base_model = cls._constrained_base_models.get(constraints)
+        if base_model is None:
+            with cls._build_lock:
+                base_model = cls._constrained_base_models.get(constraints)
+                if base_model is None:
+                    annotation = compile_constraints(cls.get_annotation(), constraints)
+                    base_model = _create_base_model(annotation, cls.__name__)
+                    cls._constrained_base_models[constraints] = base_model
+
+        return base_model
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        # Lets a parameterization such as Batch[int] be used as a field annotation.
+        annotation = compile_constraints(cls.get_annotation(), cls._get_constraints())
+        return handler.generate_schema(annotation)
+
 
 AnyType = TypeVar("AnyType")
 
@@ -123,3 +267,14 @@ def _handle_meta(data: Union[Tuple, AnyType]) -> Tuple[AnyType, Any]:
         meta = None
 
     return annotation, meta
+
+
+def _handle_parameters(cls, data: Union[Tuple, AnyType], n_parameters: int):
+    args = data if type(data) is tuple else (data,)
+    if len(args) < n_parameters:
+        raise TypeError(
+            f"Too few parameters for {cls.__name__}: expected {n_parameters}, but got {len(args)}"
+        )
+    parameterized = _parameterize(cls, args[:n_parameters])
+    meta = args[n_parameters:]
+    return _with_meta(parameterized, meta) if meta else parameterized
@@ -1,5 +1,5 @@
 import pytest
-from typing import List, Dict, TypeVar, Generic, Union
+from typing import Annotated, List, Dict, TypeVar, Generic, Union
 from pydantic import BaseModel
 from crimson.intelli_type import IntelliType
 
@@ -35,8 +35,9 @@ class TestIntelliType:
         class MyType(IntelliType[List[int]], Generic[T]):
             pass
 
-        MyType[List[int], r"meta_data"]
-        assert MyType.meta == (r"meta_data",)
+        assert MyType[List[int], r"meta_data"] == Annotated[List[int], r"meta_data"]
+        assert MyType.with_meta(r"meta_data").get_meta() == (r"meta_data",)
+        assert MyType.meta is None
 
     def test_class_getitem_type_mismatch(self):
         class MyType(IntelliType[List[int]], Generic[T]):
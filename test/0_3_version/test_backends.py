@@ -0,0 +1,207 @@
+import sys
+import pytest
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Generic, Union
+from crimson.intelli_type import IntelliType, Backend, Range, Each, register_backend, set_default_backend
+from crimson.intelli_type import backends
+from crimson.intelli_type import intelliType as intelli_type_module
+from crimson.intelli_type.benchmark import format_report, run_benchmark
+
+T = TypeVar("T")
+
+
+@pytest.fixture(autouse=True)
+def restore_backends():
+    default_backend = backends.get_default_backend()
+    registered_backends = dict(backends._backends)
+    yield
+    backends._backends.clear()
+    backends._backends.update(registered_backends)
+    set_default_backend(default_backend)
+
+
+class CountingBackend(Backend):
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def build(self, annotation, constraints=(), name="Validator"):
+        def validate(data):
+            self.calls += 1
+            return data
+
+        return validate
+
+
+class TestBackends:
+    def test_default_is_pydantic(self):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        assert MyType.type_safe(["1", 2]) == [1, 2]
+
+    def test_isinstance_backend(self):
+        class MyType(IntelliType[Dict[str, List[int]]], Generic[T]):
+            backend = "isinstance"
+
+        data = {"a": [1, 2]}
+        assert MyType.type_safe(data) is data
+        with pytest.raises(ValueError):
+            MyType.type_safe({"a": ["1"]})
+        with pytest.raises(ValueError):
+            MyType.type_safe({"a": "12"})
+
+    def test_isinstance_backend_annotations(self):
+        validate = backends.get_backend("isinstance").build(Optional[Tuple[int, ...]])
+
+        assert validate(None) is None
+        assert validate((1, 2)) == (1, 2)
+        with pytest.raises(ValueError):
+            validate([1, 2])
+
+    def test_isinstance_backend_constraints(self):
+        class MyType(IntelliType[List[int], Each(Range(ge=0))], Generic[T]):
+            backend = "isinstance"
+
+        assert MyType.type_safe([0, 1]) == [0, 1]
+        with pytest.raises(ValueError):
+            MyType.type_safe([-1])
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y unions need python 3.10")
+    def test_isinstance_backend_pep604_union(self):
+        validate = backends.get_backend("isinstance").build(eval("int | None"))
+
+        assert validate(1) == 1
+        assert validate(None) is None
+        with pytest.raises(ValueError):
+            validate("1")
+
+    def test_isinstance_backend_one_shot_iterables(self):
+        backend = backends.get_backend("isinstance")
+
+        with pytest.raises(TypeError):
+            backend.build(Iterable[int])
+        with pytest.raises(TypeError):
+            backend.build(Iterator[int])
+
+    def test_constrained_optional_on_every_backend(self):
+        class MyType(IntelliType[Optional[int], Range(ge=0)], Generic[T]):
+            pass
+
+        for backend in backends.available_backends():
+            MyType.backend = backend
+            assert MyType.type_safe(None) is None
+            assert MyType.type_safe(1) == 1
+            with pytest.raises(ValueError):
+                MyType.type_safe(-1)
+
+    def test_constraint_type_error_is_value_error(self):
+        validate = backends.get_backend("isinstance").build(Union[int, str], (Range(ge=0),))
+
+        assert validate(1) == 1
+        with pytest.raises(ValueError):
+            validate("a")
+
+    def test_isinstance_backend_unsupported(self):
+        with pytest.raises(TypeError):
+            backends.get_backend("isinstance").build("NotAType")
+
+    def test_msgspec_backend(self):
+        pytest.importorskip("msgspec")
+
+        class MyType(IntelliType[List[int]], Generic[T]):
+            backend = "msgspec"
+
+        assert MyType.type_safe([1, 2]) == [1, 2]
+        with pytest.raises(ValueError):
+            MyType.type_safe(["a"])
+
+    def test_set_default_backend(self):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        class PydanticType(IntelliType[List[int]], Generic[T]):
+            backend = "pydantic"
+
+        set_default_backend("isinstance")
+
+        with pytest.raises(ValueError):
+            MyType.type_safe(["1"])
+        assert PydanticType.type_safe(["1"]) == [1]
+
+    def test_unknown_backend(self):
+        with pytest.raises(KeyError):
+            set_default_backend("unknown")
+
+    def test_register_backend(self):
+        backend = CountingBackend()
+        register_backend(backend)
+
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        MyType.backend = "counting"
+        MyType.type_safe(["a"])
+        assert backend.calls == 1
+
+    def test_registered_backend_is_removed(self):
+        assert "counting" not in backends.available_backends()
+
+    def test_validator_is_cached(self):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            backend = "isinstance"
+
+        assert MyType.get_validator() is MyType.get_validator()
+
+    def test_validator_lookup_skips_backend_resolution(self, monkeypatch):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        MyType.type_safe([1])
+        calls = []
+        monkeypatch.setattr(intelli_type_module, "get_backend", lambda name: calls.append(name))
+
+        MyType.type_safe([1])
+        assert calls == []
+
+    def test_msgspec_availability_is_memoized(self):
+        backend = backends.MsgspecBackend()
+
+        available = backend.is_available()
+        assert backend._available is available
+
+    def test_parameterized_inherits_backend(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            backend = "isinstance"
+
+        with pytest.raises(ValueError):
+            Batch[int].type_safe(["1"])
+
+
+class TestBenchmark:
+    def test_run_benchmark(self):
+        corpus = [
+            (List[int], [[1, 2], ["a"]]),
+            (int, [1, "1"]),
+            ("NotAType", [1]),
+        ]
+        reports = run_benchmark(corpus, backends=["pydantic", "isinstance"], number=1)
+
+        assert reports[0].agree
+        assert reports[1].disagreements == (1,)
+        assert all(run.throughput > 0 for run in reports[0].runs)
+
+        assert all(run.throughput is None for run in reports[2].runs)
+        assert all(run.error is not None for run in reports[2].runs)
+
+    def test_format_report(self):
+        reports = run_benchmark([(int, [1, "1"])], backends=["pydantic", "isinstance"], number=1)
+        report = format_report(reports)
+
+        assert "pydantic (/s)" in report
+        assert "isinstance (/s)" in report
+        assert "no 1" in report
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,85 @@
+import threading
+import time
+import pytest
+from typing import List, TypeVar, Generic
+from crimson.intelli_type import IntelliType, Length
+from crimson.intelli_type import intelliType as intelli_type_module
+
+T = TypeVar("T")
+
+N_THREADS = 16
+
+
+@pytest.fixture
+def build_counter(monkeypatch):
+    builds = []
+    create_base_model = intelli_type_module._create_base_model
+
+    def slow_create_base_model(annotation, cls_name):
+        builds.append(cls_name)
+        time.sleep(0.05)
+        return create_base_model(annotation, cls_name)
+
+    monkeypatch.setattr(intelli_type_module, "_create_base_model", slow_create_base_model)
+    return builds
+
+
+def _run_concurrently(func):
+    barrier = threading.Barrier(N_THREADS)
+    results = [None] * N_THREADS
+
+    def target(i):
+        barrier.wait()
+        results[i] = func()
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(N_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestConcurrency:
+    def test_single_build_under_concurrent_first_access(self, build_counter):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        results = _run_concurrently(MyType.create_base_model)
+
+        assert build_counter == ["MyType"]
+        assert all(result is results[0] for result in results)
+
+    def test_single_build_with_constraints(self, build_counter):
+        class MyType(IntelliType[List[int], Length(min=1)], Generic[T]):
+            pass
+
+        results = _run_concurrently(lambda: MyType.type_safe([1]))
+
+        assert build_counter == ["MyType"]
+        assert results == [[1]] * N_THREADS
+
+    def test_single_build_per_parameterization(self, build_counter):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        results = _run_concurrently(lambda: Batch[int].create_base_model())
+
+        assert build_counter == ["Batch[int]"]
+        assert all(result is results[0] for result in results)
+
+    def test_classes_build_independently(self, build_counter):
+        class First(IntelliType[List[int]], Generic[T]):
+            pass
+
+        class Second(IntelliType[List[str]], Generic[T]):
+            pass
+
+        First.create_base_model()
+
+        assert Second._BaseModel is None
+        assert build_counter == ["First"]
+
+
+if __name__ == "__main__":
+    pytest.main()
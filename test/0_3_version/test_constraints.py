@@ -0,0 +1,151 @@
+import pytest
+from typing import Annotated, List, Dict, Tuple, TypeVar, Generic, get_type_hints
+from pydantic import BaseModel
+from crimson.intelli_type import IntelliType, Range, Length, Pattern, Shape, Each
+from crimson.intelli_type.constraints import compile_constraints
+
+T = TypeVar("T")
+
+
+class FakeTensor:
+    def __init__(self, *shape):
+        self.shape = shape
+
+
+class TestConstraints:
+    def test_range(self):
+        class Probability(IntelliType[float, Range(ge=0, le=1)], Generic[T]):
+            pass
+
+        assert Probability.type_safe(0.5) == 0.5
+        with pytest.raises(ValueError):
+            Probability.type_safe(1.5)
+
+    def test_length_and_each(self):
+        class Probabilities(
+            IntelliType[List[float], Each(Range(ge=0, le=1)), Length(min=1)], Generic[T]
+        ):
+            pass
+
+        assert Probabilities.type_safe([0.1, 0.9]) == [0.1, 0.9]
+        with pytest.raises(ValueError):
+            Probabilities.type_safe([])
+        with pytest.raises(ValueError):
+            Probabilities.type_safe([0.1, 2.0])
+
+    def test_each_mapping_values(self):
+        class Scores(IntelliType[Dict[str, int], Each(Range(ge=0))], Generic[T]):
+            pass
+
+        assert Scores.type_safe({"a": 1}) == {"a": 1}
+        with pytest.raises(ValueError):
+            Scores.type_safe({"a": -1})
+
+    def test_each_unsupported(self):
+        with pytest.raises(TypeError):
+            compile_constraints(int, (Each(Range(ge=0)),))
+
+    def test_pattern(self):
+        class Version(IntelliType[str, Pattern(r"^\d+\.\d+\.\d+$")], Generic[T]):
+            pass
+
+        assert Version.type_safe("0.4.0") == "0.4.0"
+        with pytest.raises(ValueError):
+            Version.type_safe("v0.4")
+
+    def test_shape_nested(self):
+        class Matrix(IntelliType[List[List[int]], Shape(2, None)], Generic[T]):
+            pass
+
+        assert Matrix.type_safe([[1, 2], [3, 4]]) == [[1, 2], [3, 4]]
+        with pytest.raises(ValueError):
+            Matrix.type_safe([[1, 2]])
+
+    def test_shape_attribute(self):
+        class FeatureMap(IntelliType[FakeTensor, Shape(None, 3, 4, 4)], Generic[T]):
+            pass
+
+        FeatureMap.type_safe(FakeTensor(8, 3, 4, 4))
+        with pytest.raises(ValueError):
+            FeatureMap.type_safe(FakeTensor(8, 3, 4))
+
+    def test_free_form_meta_is_ignored(self):
+        class MyType(IntelliType[Tuple[int, int], "(h, w)"], Generic[T]):
+            pass
+
+        assert MyType.type_safe((1, 2)) == (1, 2)
+
+    def test_compiled_once_per_meta(self):
+        class MyType(IntelliType[int, Range(ge=0)], Generic[T]):
+            pass
+
+        model = MyType.create_base_model()
+        assert MyType.create_base_model() is model
+
+        AtLeastTen = MyType.with_meta(Range(ge=10))
+        assert AtLeastTen is MyType.with_meta(Range(ge=10))
+        assert AtLeastTen.create_base_model() is AtLeastTen.create_base_model()
+        assert AtLeastTen.create_base_model() is not model
+        assert MyType.create_base_model() is model
+
+    def test_use_site_meta_does_not_modify_class(self):
+        class Probabilities(IntelliType[List[float], Each(Range(ge=0, le=1))], Generic[T]):
+            pass
+
+        def function(values: Probabilities[List[float]]):
+            pass
+
+        assert Probabilities.get_meta() == (Each(Range(ge=0, le=1)),)
+        with pytest.raises(ValueError):
+            Probabilities.type_safe([2.0])
+
+    def test_use_site_meta_is_scoped(self):
+        class MyType(IntelliType[int, Range(le=100)], Generic[T]):
+            pass
+
+        Positive = MyType.with_meta(Range(ge=0))
+        AtLeastTen = MyType.with_meta(Range(ge=10))
+
+        assert Positive.type_safe(5) == 5
+        with pytest.raises(ValueError):
+            AtLeastTen.type_safe(5)
+        with pytest.raises(ValueError):
+            Positive.type_safe(101)
+        assert MyType.type_safe(-5) == -5
+
+    def test_use_site_meta_as_field(self):
+        class MyType(IntelliType[int, Range(le=10)], Generic[T]):
+            pass
+
+        class Model(BaseModel):
+            value: MyType[int, Range(ge=0)]
+
+        assert Model(value=1).value == 1
+        with pytest.raises(ValueError):
+            Model(value=-1)
+        with pytest.raises(ValueError):
+            Model(value=11)
+
+    def test_use_site_meta_is_annotated(self):
+        class MyType(IntelliType[int, Range(le=10)], Generic[T]):
+            pass
+
+        def function(value: MyType[int, Range(ge=0)]):
+            pass
+
+        assert MyType[int, Range(ge=0)] == Annotated[int, Range(le=10), Range(ge=0)]
+        assert get_type_hints(function) == {"value": int}
+
+    def test_parameterized_with_constraints(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        NonEmpty = Batch[int, Length(min=1)]
+        assert NonEmpty.type_safe([1]) == [1]
+        with pytest.raises(ValueError):
+            NonEmpty.type_safe([])
+        assert Batch[int].type_safe([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,74 @@
+import json
+import pytest
+from datetime import date
+from typing import Dict, List, TypeVar, Generic, Union
+from pydantic import BaseModel
+from crimson.intelli_type import IntelliType, Range, Each
+
+T = TypeVar("T")
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+class TestDump:
+    def test_dump_json(self):
+        class MyType(IntelliType[Dict[str, Union[int, List[str]]]], Generic[T]):
+            pass
+
+        value = MyType.type_safe({"a": 1, "b": ["x", "y"]})
+        assert MyType.dump_json(value) == json.dumps(value, separators=(",", ":")).encode()
+
+    def test_dump_json_uses_schema(self):
+        class MyType(IntelliType[List[Point]], Generic[T]):
+            pass
+
+        value = MyType.type_safe([{"x": 1, "y": 2}])
+        assert json.loads(MyType.dump_json(value)) == [{"x": 1, "y": 2}]
+
+    def test_dump_python(self):
+        class MyType(IntelliType[List[Point]], Generic[T]):
+            pass
+
+        value = MyType.type_safe([{"x": 1, "y": 2}])
+        assert MyType.dump_python(value) == [{"x": 1, "y": 2}]
+
+    def test_dump_python_json_mode(self):
+        class MyType(IntelliType[Dict[str, date]], Generic[T]):
+            pass
+
+        value = MyType.type_safe({"day": "2024-07-16"})
+        assert MyType.dump_python(value) == {"day": date(2024, 7, 16)}
+        assert MyType.dump_python(value, mode="json") == {"day": "2024-07-16"}
+
+    def test_dump_validate(self):
+        class MyType(IntelliType[List[int], Each(Range(ge=0))], Generic[T]):
+            pass
+
+        assert MyType.dump_json(["1", 2], validate=True) == b"[1,2]"
+        with pytest.raises(ValueError):
+            MyType.dump_json([-1], validate=True)
+
+    def test_dump_model(self):
+        class MyType(IntelliType[Point], Generic[T]):
+            pass
+
+        assert MyType.dump_json({"x": 1, "y": 2}, validate=True) == b'{"x":1,"y":2}'
+
+    def test_type_adapter_is_cached(self):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        assert MyType.get_type_adapter() is MyType.get_type_adapter()
+
+    def test_dump_parameterized(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        assert Batch[int].dump_json(Batch[int].type_safe([1, 2])) == b"[1,2]"
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,95 @@
+import os
+import sys
+import pytest
+from crimson.intelli_type import extractor
+from crimson.intelli_type.extractor import (
+    extract_intelli_types,
+    extract_source,
+    scan_intelli_types,
+)
+
+SOURCE = '''
+import heavy_dependency_that_is_not_installed
+from typing import List, Tuple, Generic, TypeVar
+from crimson.intelli_type import IntelliType
+
+T = TypeVar("T")
+
+
+class Plain:
+    pass
+
+
+class Batch(IntelliType[List[T]], Generic[T]):
+    """
+    A batch of items.
+    """
+
+
+class Shape(IntelliType[Tuple[int, int], "(h, w)", 3], Generic[T]):
+    pass
+'''
+
+
+class TestExtractor:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        extractor.clear_cache()
+        yield
+        extractor.clear_cache()
+
+    def test_extract_source(self):
+        batch, shape = extract_source(SOURCE)
+
+        assert batch.name == "Batch"
+        assert batch.annotation == "List[T]"
+        assert batch.meta is None
+        assert batch.doc == "A batch of items."
+        assert batch.parameters == ("T",)
+
+        assert shape.annotation == "Tuple[int, int]"
+        assert shape.meta == ("(h, w)", 3)
+        assert shape.doc is None
+
+    def test_extract_does_not_import(self, tmp_path):
+        path = tmp_path / "types_module.py"
+        path.write_text(SOURCE)
+
+        infos = extract_intelli_types(str(path))
+
+        assert [info.name for info in infos] == ["Batch", "Shape"]
+        assert "types_module" not in sys.modules
+
+    def test_extract_cache_by_mtime_and_hash(self, tmp_path):
+        path = tmp_path / "types_module.py"
+        path.write_text(SOURCE)
+
+        first = extract_intelli_types(str(path))
+        assert extract_intelli_types(str(path)) is first
+
+        os.utime(path, ns=(0, 0))
+        assert extract_intelli_types(str(path)) is first
+
+        path.write_text(SOURCE.replace("Batch", "Group"))
+        os.utime(path, ns=(1, 1))
+        assert [info.name for info in extract_intelli_types(str(path))] == ["Group", "Shape"]
+
+    def test_scan_tree_parallel(self, tmp_path):
+        for i in range(extractor._PARALLEL_THRESHOLD + 4):
+            package = tmp_path / f"package_{i % 3}"
+            package.mkdir(exist_ok=True)
+            (package / f"module_{i}.py").write_text(SOURCE)
+        (tmp_path / "empty.py").write_text("x = 1\n")
+        (tmp_path / "broken.py").write_text("class (:\n")
+
+        parallel = scan_intelli_types(str(tmp_path), max_workers=2)
+        extractor.clear_cache()
+        sequential = scan_intelli_types(str(tmp_path), max_workers=1)
+
+        assert len(parallel) == extractor._PARALLEL_THRESHOLD + 4
+        assert parallel == sequential
+        assert scan_intelli_types(str(tmp_path)) == parallel
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,154 @@
+import gc
+import weakref
+import pytest
+from typing import List, Dict, Tuple, TypeVar, Generic
+from pydantic import BaseModel
+from crimson.intelli_type import IntelliType, Length
+from crimson.intelli_type import _util
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+class TestParameterized:
+    def test_parameterization_annotation(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            """Batch description."""
+
+        assert Batch.get_parameters() == (T,)
+        assert Batch[int].annotation == List[int]
+        assert Batch[str].annotation == List[str]
+
+    def test_parameterization_reuses_doc(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            """Batch description."""
+
+        assert Batch[int].__doc__ == "Batch description."
+        assert issubclass(Batch[int], Batch)
+
+    def test_parameterization_is_cached(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        assert Batch[int] is Batch[int]
+        assert Batch[int] is not Batch[str]
+        assert Batch[int].create_base_model() is Batch[int].create_base_model()
+        assert Batch[int].create_base_model() is not Batch[str].create_base_model()
+
+    def test_parameterization_identity_is_kept(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        first = Batch[int]
+        others = [Batch[Tuple[(int,) * i]] for i in range(1, 300)]
+        assert Batch[int] is first
+        assert len(others) == 299
+
+    def test_recent_parameterization_survives_gc(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        model = Batch[int].create_base_model()
+        gc.collect()
+        assert Batch[int].create_base_model() is model
+
+    def test_unreferenced_parameterization_is_released(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        reference = weakref.ref(Batch[float])
+        for size in range(1, _util._RECENT_SPECIALIZATIONS_SIZE + 1):
+            Batch[Tuple[(int,) * size]]
+        gc.collect()
+        assert reference() is None
+
+    def test_parameterization_validator_is_lazy(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        assert Batch[int]._BaseModel is None
+        Batch[int].type_safe([1])
+        assert Batch[int]._BaseModel is not None
+        assert Batch._BaseModel is None
+
+    def test_parameterization_ignores_pending_annotation(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        IntelliType[float]
+        assert Batch[bytes].annotation == List[bytes]
+
+        class Other(IntelliType[List[str]], Generic[T]):
+            pass
+
+        assert Other.annotation == List[str]
+
+    def test_parameterization_type_safe(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        assert Batch[int].type_safe([1, 2]) == [1, 2]
+        with pytest.raises(ValueError):
+            Batch[int].type_safe(["a"])
+
+    def test_parameterization_with_meta(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        assert Batch[int, "meta_data"].get_meta() == ("meta_data",)
+        assert Batch.get_meta() is None
+
+    def test_parameterization_keeps_class_meta(self):
+        class Batch(IntelliType[List[T], Length(min=1)], Generic[T]):
+            pass
+
+        assert Batch[int].get_meta() == (Length(min=1),)
+        assert Batch[int, "meta_data"].get_meta() == (Length(min=1), "meta_data")
+        with pytest.raises(ValueError):
+            Batch[int].type_safe([])
+
+    def test_parameterization_with_unhashable_meta(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        assert Batch[int, {"unit": "m"}].get_meta() == ({"unit": "m"},)
+        assert Batch[int, ["a"]].type_safe([1]) == [1]
+
+    def test_multiple_parameters(self):
+        class Mapping(IntelliType[Dict[K, T]], Generic[K, T]):
+            pass
+
+        assert Mapping[str, int].annotation == Dict[str, int]
+        with pytest.raises(TypeError):
+            Mapping[str]
+
+    def test_parameters_follow_generic_order(self):
+        class Mapping(IntelliType[Dict[T, K]], Generic[K, T]):
+            pass
+
+        assert Mapping.get_parameters() == (K, T)
+        assert Mapping[str, int].annotation == Dict[int, str]
+
+    def test_parameterization_as_field(self):
+        class Batch(IntelliType[List[T]], Generic[T]):
+            pass
+
+        class Model(BaseModel):
+            data: Batch[int]
+
+        assert Model(data=[1, 2]).data == [1, 2]
+        with pytest.raises(ValueError):
+            Model(data=["a"])
+
+    def test_subclass_keeps_parent_annotation(self):
+        class MyType(IntelliType[List[int]], Generic[T]):
+            pass
+
+        class Child(MyType):
+            pass
+
+        assert Child.annotation == List[int]
+
+
+if __name__ == "__main__":
+    pytest.main()